@@ -1,10 +1,19 @@
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 import re
+import sys
 import asyncio
+import atexit
+import concurrent.futures
 import json
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Optional, List, Set, Tuple, Union, Dict
+from functools import lru_cache, partial
+from typing import Any, FrozenSet, Optional, List, Set, Tuple, Union, Dict
 import argparse
 
 try:
@@ -12,6 +21,21 @@ try:
 except ImportError:
     load_dotenv = None
 
+try:
+    import re2  # linear-time engine, used for untrusted message text
+except ImportError:
+    re2 = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None  # type: ignore
+
 try:
     import MetaTrader5 as mt5
 except ImportError:  # environment might not have MetaTrader5
@@ -26,9 +50,35 @@ except ImportError:
     User = None  # type: ignore
 
 
-logging.basicConfig(level=logging.INFO)
+# records never use thread/process fields, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+# handlers write from a listener thread so stderr I/O never blocks the loop;
+# QueueHandler has no formatter of its own, so records are formatted once
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
+# registered first so it runs last and drains records logged at exit
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        # ticket keys are ints; json.dumps would stringify them too
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 if load_dotenv is not None:
     load_dotenv()
 
@@ -41,40 +91,97 @@ ALLOWED_CHANNELS: List[str] = [
     c.strip() for c in os.getenv("TELEGRAM_CHANNELS", "").split(",") if c.strip()
 ]
 
-def _parse_allowed(raw: List[str]) -> Tuple[Set[int], Set[str]]:
+# one scan finds the action/symbol pair and the sl/tp levels; inline flags
+# keep the pattern portable between re and re2. re2 classes are ASCII-only,
+# so digits are spelled [0-9] and parse_signal folds every Unicode space to
+# " " first; both engines then see the same text.
+_SIGNAL_RE = (re2 or re).compile(
+    r"(?i)(?P<action>buy|sell) +(?P<symbol>[^ ]+)"
+    r"|sl[: ]*(?P<sl>[0-9]+(?:\.[0-9]+)?)"
+    r"|tp[: ]*(?P<tp>[0-9]+(?:\.[0-9]+)?)"
+)
+
+
+def _isintlit(s: str) -> bool:
+    """Return True if ``s`` is an optionally negative decimal integer."""
+    # isdecimal rather than isdigit: int() rejects digits such as superscripts
+    return bool(s) and (s[1:] if s[0] == "-" else s).isdecimal()
+
+
+def _parse_allowed(raw: List[str]) -> Tuple[FrozenSet[int], FrozenSet[str]]:
     ids: Set[int] = set()
     names: Set[str] = set()
     for item in raw:
-        if re.fullmatch(r"-?\d+", item):
+        if _isintlit(item):
             ids.add(int(item))
         else:
             names.add(item.lower())
-    return ids, names
+    return frozenset(ids), frozenset(names)
 
 
 ALLOWED_ID_SET, ALLOWED_NAME_SET = _parse_allowed(ALLOWED_CHANNELS)
+_FILTER_ENABLED = bool(ALLOWED_ID_SET) or bool(ALLOWED_NAME_SET)
+# chat ids already seen passing the channel filter; denials are not cached
+# because the chat entity may be missing on the first message, and only
+# configured chats can end up here so the set stays small
+_chat_allow_cache: Set[int] = set()
 
 SYMBOLS_FILE = "available_symbols.json"
-AVAILABLE_SYMBOLS: Set[str] = set()
+# rebuilt wholesale on refresh; names are interned so lookups compare by identity
+AVAILABLE_SYMBOLS: FrozenSet[str] = frozenset()
 
 
 MESSAGE_POSITIONS: Dict[int, List[int]] = {}
 OPEN_POSITIONS_FILE = "open_positions.json"
+# one JSON line per change since the last snapshot in OPEN_POSITIONS_FILE
+OPEN_POSITIONS_LOG = "open_positions.log"
 OPEN_POSITIONS: Dict[int, Dict[str, Union[str, float, int]]] = {}
+# symbol -> tickets in OPEN_POSITIONS; only symbols with open tickets are keys
+OPEN_BY_SYMBOL: Dict[str, Set[int]] = defaultdict(set)
+COMPACT_EVERY = 1000
+JOURNAL_FLUSH_DELAY = 0.2
+_positions_log = None
+_positions_log_events = 0
+# journal lines buffered on the event loop until journal_flusher writes them
+_pending_journal: List[bytes] = []
+_journal_dirty = asyncio.Event()
+# guards _pending_journal and OPEN_POSITIONS snapshots against flush threads
+_positions_lock = threading.Lock()
+# serializes journal/snapshot file access
+_journal_io_lock = threading.Lock()
 
 
 def _to_input(value: str) -> Union[int, str]:
     """Return int for numeric identifiers or the original string."""
-    return int(value) if re.fullmatch(r"-?\d+", value) else value
+    return int(value) if _isintlit(value) else value
+
+
+def _write_atomic(path: str, data) -> None:
+    """Write ``data`` as JSON to ``path`` via a temporary file and rename."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _index_open_positions() -> None:
+    """Rebuild OPEN_BY_SYMBOL from OPEN_POSITIONS."""
+    OPEN_BY_SYMBOL.clear()
+    for ticket, data in OPEN_POSITIONS.items():
+        symbol = data.get("symbol")
+        if symbol is not None:
+            OPEN_BY_SYMBOL[symbol].add(ticket)
 
 
 def load_open_positions() -> None:
-    """Load saved open positions from disk."""
+    """Load saved open positions from disk and replay the journal."""
     global OPEN_POSITIONS
     if os.path.exists(OPEN_POSITIONS_FILE):
         try:
-            with open(OPEN_POSITIONS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(OPEN_POSITIONS_FILE, "rb") as f:
+                data = _loads(f.read())
             OPEN_POSITIONS = {int(k): v for k, v in data.items()}
         except Exception as exc:
             logger.warning("Failed to load %s: %s", OPEN_POSITIONS_FILE, exc)
@@ -82,30 +189,148 @@ def load_open_positions() -> None:
     else:
         OPEN_POSITIONS = {}
 
+    if os.path.exists(OPEN_POSITIONS_LOG):
+        try:
+            with open(OPEN_POSITIONS_LOG, "rb") as f:
+                for line in f:
+                    event = _loads(line)
+                    if event["op"] == "set":
+                        OPEN_POSITIONS[event["ticket"]] = event["data"]
+                    else:
+                        OPEN_POSITIONS.pop(event["ticket"], None)
+        except Exception as exc:
+            # a torn final line from a crash ends the replay there
+            logger.warning("Failed to replay %s: %s", OPEN_POSITIONS_LOG, exc)
+    _index_open_positions()
+
 
-def save_open_positions() -> None:
-    """Persist open positions to disk."""
+def _append_position_event(event: Dict[str, Any]) -> None:
+    """Buffer one change for the open positions journal."""
+    with _positions_lock:
+        _pending_journal.append(_dumps(event) + b"\n")
+    _journal_dirty.set()
+
+
+def record_open_position(ticket: int, data: Dict[str, Union[str, float, int]]) -> None:
+    """Track a newly opened position."""
+    OPEN_POSITIONS[ticket] = data
+    symbol = data.get("symbol")
+    if symbol is not None:
+        OPEN_BY_SYMBOL[symbol].add(ticket)
+    _append_position_event({"op": "set", "ticket": ticket, "data": data})
+
+
+def forget_open_position(ticket: int) -> None:
+    """Stop tracking a closed position."""
+    data = OPEN_POSITIONS.pop(ticket, None)
+    if data is None:
+        return
+    tickets = OPEN_BY_SYMBOL.get(data.get("symbol"))
+    if tickets is not None:
+        tickets.discard(ticket)
+        if not tickets:
+            del OPEN_BY_SYMBOL[data["symbol"]]
+    _append_position_event({"op": "del", "ticket": ticket})
+
+
+def _write_snapshot(snapshot: Dict[int, Dict[str, Union[str, float, int]]]) -> None:
+    """Replace the snapshot file and truncate the journal it supersedes."""
+    global _positions_log, _positions_log_events
     try:
-        with open(OPEN_POSITIONS_FILE, "w", encoding="utf-8") as f:
-            json.dump(OPEN_POSITIONS, f)
+        _write_atomic(OPEN_POSITIONS_FILE, snapshot)
+        if _positions_log is not None:
+            _positions_log.close()
+            _positions_log = None
+        # the journal on disk already holds every change in the snapshot, so
+        # replaying it over the new snapshot lands on the same state and
+        # truncating after the rename is crash-safe
+        open(OPEN_POSITIONS_LOG, "wb").close()
+        _positions_log_events = 0
     except Exception as exc:
         logger.warning("Failed to save %s: %s", OPEN_POSITIONS_FILE, exc)
 
 
+def _append_journal(lines: bytes) -> bool:
+    """Append ``lines`` to the journal with a single fsync."""
+    global _positions_log
+    try:
+        if _positions_log is None:
+            _positions_log = open(OPEN_POSITIONS_LOG, "ab")
+        _positions_log.write(lines)
+        _positions_log.flush()
+        os.fsync(_positions_log.fileno())
+    except Exception as exc:
+        logger.warning("Failed to write %s: %s", OPEN_POSITIONS_LOG, exc)
+        return False
+    return True
+
+
+def flush_position_journal(compact: bool = False) -> None:
+    """Write buffered journal lines with a single fsync, compacting if due."""
+    global _positions_log_events
+    with _journal_io_lock:
+        with _positions_lock:
+            lines = b"".join(_pending_journal)
+            count = len(_pending_journal)
+            _pending_journal.clear()
+            compact = compact or _positions_log_events + count >= COMPACT_EVERY
+            snapshot = dict(OPEN_POSITIONS) if compact else None
+        # buffered lines reach the journal before any snapshot that includes
+        # them, otherwise a crash before truncation would replay stale entries
+        if lines:
+            if not _append_journal(lines):
+                return
+            _positions_log_events += count
+        if snapshot is not None:
+            _write_snapshot(snapshot)
+
+
+def compact_open_positions() -> None:
+    """Snapshot open positions to disk and truncate the journal."""
+    flush_position_journal(compact=True)
+
+
+atexit.register(flush_position_journal)
+
+
+async def journal_flusher():
+    """Coalesce journal changes into one write every JOURNAL_FLUSH_DELAY."""
+    while True:
+        await _journal_dirty.wait()
+        await asyncio.sleep(JOURNAL_FLUSH_DELAY)
+        _journal_dirty.clear()
+        await asyncio.to_thread(flush_position_journal)
+
+
+def _replace_open_positions(positions) -> None:
+    """Rebuild OPEN_POSITIONS and its index from an MT5 positions snapshot."""
+    fresh = {
+        pos.ticket: {"symbol": pos.symbol, "volume": pos.volume, "type": pos.type}
+        for pos in positions
+    }
+    # swap under the lock so a concurrent compaction never snapshots a
+    # half-filled dict, and journal the difference so the journal keeps
+    # covering every change a later snapshot includes
+    with _positions_lock:
+        for ticket in OPEN_POSITIONS.keys() - fresh.keys():
+            _pending_journal.append(_dumps({"op": "del", "ticket": ticket}) + b"\n")
+        for ticket, data in fresh.items():
+            if OPEN_POSITIONS.get(ticket) != data:
+                _pending_journal.append(_dumps({"op": "set", "ticket": ticket, "data": data}) + b"\n")
+        OPEN_POSITIONS.clear()
+        OPEN_POSITIONS.update(fresh)
+    _index_open_positions()
+    _journal_dirty.set()
+
+
 def refresh_open_positions() -> None:
     """Fetch current MT5 positions and persist them."""
     if mt5 is None:
         OPEN_POSITIONS.clear()
+        OPEN_BY_SYMBOL.clear()
         return
-    positions = mt5.positions_get() or []
-    OPEN_POSITIONS.clear()
-    for pos in positions:
-        OPEN_POSITIONS[pos.ticket] = {
-            "symbol": pos.symbol,
-            "volume": pos.volume,
-            "type": pos.type,
-        }
-    save_open_positions()
+    _replace_open_positions(mt5.positions_get() or [])
+    compact_open_positions()
 
 
 def load_symbols() -> None:
@@ -113,42 +338,44 @@ def load_symbols() -> None:
     global AVAILABLE_SYMBOLS
     if os.path.exists(SYMBOLS_FILE):
         try:
-            with open(SYMBOLS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(SYMBOLS_FILE, "rb") as f:
+                data = _loads(f.read())
             if isinstance(data, list):
-                AVAILABLE_SYMBOLS = {s.upper() for s in data}
+                AVAILABLE_SYMBOLS = frozenset(sys.intern(s.upper()) for s in data)
             else:
-                AVAILABLE_SYMBOLS = set()
+                AVAILABLE_SYMBOLS = frozenset()
         except Exception as exc:
             logger.warning("Failed to load %s: %s", SYMBOLS_FILE, exc)
-            AVAILABLE_SYMBOLS = set()
+            AVAILABLE_SYMBOLS = frozenset()
     else:
-        AVAILABLE_SYMBOLS = set()
+        AVAILABLE_SYMBOLS = frozenset()
+    _parse_signal_cached.cache_clear()
 
 
 def save_symbols() -> None:
     """Persist available symbols to disk."""
     try:
-        with open(SYMBOLS_FILE, "w", encoding="utf-8") as f:
-            json.dump(sorted(AVAILABLE_SYMBOLS), f)
+        _write_atomic(SYMBOLS_FILE, sorted(AVAILABLE_SYMBOLS))
     except Exception as exc:
         logger.warning("Failed to save %s: %s", SYMBOLS_FILE, exc)
 
 
 def refresh_symbols() -> None:
     """Fetch available MT5 symbols and persist them."""
+    global AVAILABLE_SYMBOLS
+    # parsed signals depend on AVAILABLE_SYMBOLS, so drop memoized results
+    _parse_signal_cached.cache_clear()
     if mt5 is None:
-        AVAILABLE_SYMBOLS.clear()
+        AVAILABLE_SYMBOLS = frozenset()
         return
-    symbols = mt5.symbols_get() or []
-    AVAILABLE_SYMBOLS.clear()
-    for sym in symbols:
-        name = getattr(sym, "name", None)
-        if isinstance(name, str):
-            AVAILABLE_SYMBOLS.add(name.upper())
+    AVAILABLE_SYMBOLS = frozenset(
+        sys.intern(name.upper())
+        for sym in (mt5.symbols_get() or ())
+        if isinstance(name := getattr(sym, "name", None), str)
+    )
     save_symbols()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradeSignal:
     action: str
     symbol: str
@@ -157,29 +384,47 @@ class TradeSignal:
     take_profit: Optional[float] = None
 
 
+# tickets watched by monitor_loop; handle_event queues new tickets and sets
+# the event, the loop drains the queue into _open_tickets
+_open_tickets: Dict[int, TradeSignal] = {}
+_breakeven_tickets: Set[int] = set()
+_monitor_q: "asyncio.Queue[Tuple[int, TradeSignal]]" = asyncio.Queue(maxsize=256)
+_monitor_wakeup = asyncio.Event()
+
+
 def parse_signal(text: str) -> Optional[TradeSignal]:
     """Parse a Telegram message into a trading signal."""
-    pattern = re.compile(
-        r"(?P<action>buy|sell)\s+(?P<symbol>\S+)(?:\s+(?P<timeframe>\S+))?",
-        re.IGNORECASE,
-    )
-    match = pattern.search(text)
-    if not match:
+    return _parse_signal_cached(" ".join(text.split()))
+
+
+# channels mirror identical texts; signals are frozen so sharing them is safe
+@lru_cache(maxsize=2048)
+def _parse_signal_cached(text: str) -> Optional[TradeSignal]:
+    action = symbol = timeframe = None
+    stop_loss = take_profit = None
+    for match in _SIGNAL_RE.finditer(text):
+        if match.group("action"):
+            if action is None:
+                action = match.group("action").lower()
+                symbol = sys.intern(match.group("symbol").upper())
+                # the timeframe is the next token, left unconsumed so that an
+                # sl/tp written right after the symbol is still scanned
+                rest = text[match.end():].split(None, 1)
+                timeframe = rest[0] if rest else None
+        elif match.group("sl"):
+            if stop_loss is None:
+                stop_loss = float(match.group("sl"))
+        elif take_profit is None:
+            take_profit = float(match.group("tp"))
+    if action is None:
         return None
 
-    action = match.group("action").lower()
-    symbol = match.group("symbol").upper()
     synonyms = {"VOL": "Volatility", "VIX": "Volatility"}
     symbol = synonyms.get(symbol, symbol)
     if AVAILABLE_SYMBOLS and symbol not in AVAILABLE_SYMBOLS:
         logger.error("Symbol %s not found", symbol)
         return None
-    timeframe = match.group("timeframe") or "1s"
-
-    sl_match = re.search(r"sl[:\s]*(\d+(?:\.\d+)?)", text, re.IGNORECASE)
-    tp_match = re.search(r"tp[:\s]*(\d+(?:\.\d+)?)", text, re.IGNORECASE)
-    stop_loss = float(sl_match.group(1)) if sl_match else None
-    take_profit = float(tp_match.group(1)) if tp_match else None
+    timeframe = timeframe or "1s"
 
     return TradeSignal(
         action=action,
@@ -190,8 +435,23 @@ def parse_signal(text: str) -> Optional[TradeSignal]:
     )
 
 
+_mt5_ready = False
+# MT5 calls block on terminal/broker round-trips; async callers run them here.
+# The binding is not documented as thread-safe, so a single worker keeps
+# every call serialized.
+_MT5_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="mt5")
+
+
+async def _mt5_call(fn, *args, **kwargs):
+    """Run a blocking MT5 call in the MT5 executor."""
+    return await asyncio.get_running_loop().run_in_executor(_MT5_EXECUTOR, partial(fn, *args, **kwargs))
+
+
 def connect_mt5() -> bool:
     """Initialize connection to MT5 using credentials from environment."""
+    global _mt5_ready
+    if _mt5_ready:
+        return True
     if mt5 is None:
         logger.error("MetaTrader5 package is not installed.")
         return False
@@ -200,6 +460,7 @@ def connect_mt5() -> bool:
     kwargs = {"path": path} if path else {}
 
     if mt5.initialize(**kwargs):
+        _mt5_ready = True
         return True
     else:
         code, msg = mt5.last_error()
@@ -211,6 +472,7 @@ def connect_mt5() -> bool:
     if login and password and server:
         kwargs.update({"login": login, "password": password, "server": server})
         if mt5.initialize(**kwargs):
+            _mt5_ready = True
             return True
         else:
             code, msg = mt5.last_error()
@@ -220,27 +482,102 @@ def connect_mt5() -> bool:
     return False
 
 
+def shutdown_mt5() -> None:
+    """Close the MT5 connection if it was initialized."""
+    global _mt5_ready
+    if _mt5_ready:
+        mt5.shutdown()
+        _mt5_ready = False
+
+
+atexit.register(shutdown_mt5)
+
+
 def calculate_lot(balance: float, risk_percent: float = 1.0) -> float:
     """Return lot size based on account balance and risk."""
     risk_amount = balance * risk_percent / 100.0
-    lot = max(round(risk_amount / 100.0, 2), 0.01)
-    return lot
+    lot = round(risk_amount / 100.0, 2)
+    return lot if lot > 0.01 else 0.01
 
 
-def has_open_positions() -> bool:
-    """Return True if there are any open MT5 positions."""
-    if mt5 is None:
-        return False
+ACCOUNT_INFO_TTL = 0.5
+SYMBOL_INFO_TTL = 5.0
+TICK_TTL = 0.5
+# (call name, *args) -> (monotonic fetch time, result)
+_MT5_CACHE: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+
+def _cache_get(key: Tuple[Any, ...], ttl: float):
+    """Return a cached MT5 result younger than ttl seconds, or None."""
+    entry = _MT5_CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _symbol_info_cached(symbol: str):
+    """Return symbol info, making sure the symbol is selected."""
+    key = ("symbol_info", symbol)
+    info = _cache_get(key, SYMBOL_INFO_TTL)
+    if info is not None:
+        return info
+
+    info = mt5.symbol_info(symbol)
+    if info is None:
+        logger.error("Symbol %s not found", symbol)
+        return None
+    if not info.visible:
+        if not mt5.symbol_select(symbol, True):
+            logger.error("Failed to select symbol %s", symbol)
+            return None
+    _MT5_CACHE[key] = (time.monotonic(), info)
+    return info
+
+
+def _tick_cached(symbol: str):
+    """Return the latest tick for ``symbol``, reused for TICK_TTL seconds."""
+    key = ("symbol_info_tick", symbol)
+    tick = _cache_get(key, TICK_TTL)
+    if tick is not None:
+        return tick
+
+    tick = mt5.symbol_info_tick(symbol)
+    if tick is not None:
+        _MT5_CACHE[key] = (time.monotonic(), tick)
+    return tick
+
+
+def _account_info_cached():
+    """Return account info; deals invalidate it via ``_invalidate_account_info``."""
+    key = ("account_info",)
+    info = _cache_get(key, ACCOUNT_INFO_TTL)
+    if info is not None:
+        return info
+
+    info = mt5.account_info()
+    if info is not None:
+        _MT5_CACHE[key] = (time.monotonic(), info)
+    return info
+
+
+def _invalidate_account_info() -> None:
+    """Drop cached account info after a deal changed equity or margin."""
+    _MT5_CACHE.pop(("account_info",), None)
+
+
+def _positions_get_sync():
+    """Return open positions and, when the call failed, MT5's last error."""
+    # read the error in the same executor job so no other call can replace it
     positions = mt5.positions_get()
-    return bool(positions)
+    return positions, (mt5.last_error() if positions is None else None)
 
 
-def can_open_trade() -> bool:
+def _can_open_trade_sync() -> bool:
     """Check if there is enough free margin to open a new trade."""
     if mt5 is None:
         return False
 
-    account = mt5.account_info()
+    account = _account_info_cached()
     if account is None:
         return False
 
@@ -249,12 +586,37 @@ def can_open_trade() -> bool:
     return free_margin > required_margin
 
 
-def place_order(signal: TradeSignal):
+async def can_open_trade() -> bool:
+    """Run ``_can_open_trade_sync`` in the MT5 executor."""
+    return await _mt5_call(_can_open_trade_sync)
+
+
+# fields shared by every market deal request; copied and filled per order.
+# mt5 constants are read once here rather than through the module per call.
+_ORDER_TEMPLATE: Dict[str, Union[str, float, int]] = {}
+_CLOSE_TEMPLATE: Dict[str, Union[str, float, int]] = {}
+if mt5 is not None:
+    _ORDER_TYPE_BUY = mt5.ORDER_TYPE_BUY
+    _ORDER_TYPE_SELL = mt5.ORDER_TYPE_SELL
+    _RETCODE_DONE = mt5.TRADE_RETCODE_DONE
+    _TRADE_ACTION_SLTP = mt5.TRADE_ACTION_SLTP
+    _ORDER_TEMPLATE = {
+        "action": mt5.TRADE_ACTION_DEAL,
+        "deviation": 20,
+        "magic": 1000,
+        "comment": "telegram signal",
+        "type_time": mt5.ORDER_TIME_GTC,
+        "type_filling": mt5.ORDER_FILLING_IOC,
+    }
+    _CLOSE_TEMPLATE = dict(_ORDER_TEMPLATE, comment="reversal close")
+
+
+def _place_order_sync(signal: TradeSignal):
     if mt5 is None:
         logger.error("MT5 not available")
         return
 
-    account_info = mt5.account_info()
+    account_info = _account_info_cached()
     if account_info is None:
         logger.error("Unable to get account info")
         return
@@ -262,155 +624,265 @@ def place_order(signal: TradeSignal):
     equity = account_info.equity
     lot = calculate_lot(equity, RISK_PERCENT)
 
-    symbol_info = mt5.symbol_info(signal.symbol)
-    if symbol_info is None:
-        logger.error("Symbol %s not found", signal.symbol)
+    if _symbol_info_cached(signal.symbol) is None:
         return
-    if not symbol_info.visible:
-        if not mt5.symbol_select(signal.symbol, True):
-            logger.error("Failed to select symbol %s", signal.symbol)
-            return
 
     tick = mt5.symbol_info_tick(signal.symbol)
     if tick is None:
         logger.error("No tick data for %s", signal.symbol)
         return
+    # orders always price off a fresh tick; the monitor pass that the new
+    # ticket wakes can reuse it
+    _MT5_CACHE[("symbol_info_tick", signal.symbol)] = (time.monotonic(), tick)
 
-    order_type = mt5.ORDER_TYPE_BUY if signal.action == "buy" else mt5.ORDER_TYPE_SELL
+    order_type = _ORDER_TYPE_BUY if signal.action == "buy" else _ORDER_TYPE_SELL
     price = tick.ask if signal.action == "buy" else tick.bid
 
-    request = {
-        "action": mt5.TRADE_ACTION_DEAL,
-        "symbol": signal.symbol,
-        "volume": lot,
-        "type": order_type,
-        "price": price,
-        "deviation": 20,
-        "magic": 1000,
-        "comment": "telegram signal",
-        "type_time": mt5.ORDER_TIME_GTC,
-        "type_filling": mt5.ORDER_FILLING_IOC,
-    }
+    request = _ORDER_TEMPLATE.copy()
+    request["symbol"] = signal.symbol
+    request["volume"] = lot
+    request["type"] = order_type
+    request["price"] = price
     if signal.stop_loss is not None:
         request["sl"] = signal.stop_loss
     if signal.take_profit is not None:
         request["tp"] = signal.take_profit
     result = mt5.order_send(request)
-    if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
+    if result is None or result.retcode != _RETCODE_DONE:
         logger.error("Order failed: %s", result)
         return
+    _invalidate_account_info()
 
-    logger.info("Order %s placed, ticket %s", signal.action, result.order)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Order %s placed, ticket %s", signal.action, result.order)
     return result.order
 
 
-def set_break_even(ticket: int, price: float):
+async def place_order(signal: TradeSignal):
+    """Run ``_place_order_sync`` in the MT5 executor."""
+    return await _mt5_call(_place_order_sync, signal)
+
+
+def _set_break_even_sync(ticket: int, price: float):
     """Move stop-loss to the entry price."""
     if mt5 is None:
         return
 
     request = {
-        "action": mt5.TRADE_ACTION_SLTP,
+        "action": _TRADE_ACTION_SLTP,
         "position": ticket,
         "sl": price,
     }
     result = mt5.order_send(request)
-    if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
+    if result is None or result.retcode != _RETCODE_DONE:
         logger.error("Failed to set break even: %s", result)
     else:
         logger.info("Break even set for ticket %s", ticket)
 
 
-def update_sl_tp(ticket: int, sl: float, tp: float):
+async def set_break_even(ticket: int, price: float):
+    """Run ``_set_break_even_sync`` in the MT5 executor."""
+    await _mt5_call(_set_break_even_sync, ticket, price)
+
+
+def _update_sl_tp_sync(ticket: int, sl: float, tp: float):
     """Update stop loss and take profit for an open position."""
     if mt5 is None:
         return
 
     request = {
-        "action": mt5.TRADE_ACTION_SLTP,
+        "action": _TRADE_ACTION_SLTP,
         "position": ticket,
         "sl": sl,
         "tp": tp,
     }
     result = mt5.order_send(request)
-    if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
+    if result is None or result.retcode != _RETCODE_DONE:
         logger.error("Failed to update SL/TP: %s", result)
     else:
         logger.info("SL/TP updated for ticket %s", ticket)
 
 
-def check_reversal_and_close(ticket: int, signal: TradeSignal):
-    """Close trade if price moves against position beyond threshold."""
+async def update_sl_tp(ticket: int, sl: float, tp: float):
+    """Run ``_update_sl_tp_sync`` in the MT5 executor."""
+    await _mt5_call(_update_sl_tp_sync, ticket, sl, tp)
+
+
+def _close_position_sync(position, signal: TradeSignal, close_type: int, price: float) -> bool:
+    """Close ``position`` with an opposing deal at ``price``."""
     if mt5 is None:
-        return
+        return False
 
-    positions = mt5.positions_get(ticket=ticket)
-    if not positions:
-        return
-    position = positions[0]
-    entry_price = position.price_open
-    volume = position.volume
+    request = _CLOSE_TEMPLATE.copy()
+    request["position"] = position.ticket
+    request["symbol"] = signal.symbol
+    request["volume"] = position.volume
+    request["type"] = close_type
+    request["price"] = price
+    result = mt5.order_send(request)
+    if result is None or result.retcode != _RETCODE_DONE:
+        logger.error("Failed to close position: %s", result)
+        return False
+    _invalidate_account_info()
+    logger.info("Position %s closed", position.ticket)
+    return True
 
-    tick = mt5.symbol_info_tick(signal.symbol)
-    if tick is None:
-        return
 
-    current_price = tick.bid if signal.action == "buy" else tick.ask
-    # close if price reverses by more than 0.5%
-    if signal.action == "buy" and current_price < entry_price * 0.995:
-        close_type = mt5.ORDER_TYPE_SELL
-    elif signal.action == "sell" and current_price > entry_price * 1.005:
-        close_type = mt5.ORDER_TYPE_BUY
-    else:
+async def close_position(position, signal: TradeSignal, close_type: int, price: float):
+    """Run ``_close_position_sync`` in the MT5 executor."""
+    if await _mt5_call(_close_position_sync, position, signal, close_type, price):
+        forget_open_position(position.ticket)
+
+
+MONITOR_RETRY_DELAY = 5.0
+
+
+async def _monitor_pass() -> Optional[float]:
+    """Check every watched ticket once and return the delay until the next pass."""
+    while not _monitor_q.empty():
+        ticket, signal = _monitor_q.get_nowait()
+        _open_tickets[ticket] = signal
+    # with nothing to watch, sleep until handle_event queues a ticket
+    if not _open_tickets:
+        return None
+    # the watchdog is reconnecting; it wakes us once the terminal is back
+    if not _mt5_ready:
+        return MONITOR_RETRY_DELAY
+
+    positions, error = await _mt5_call(_positions_get_sync)
+    if positions is None:
+        # a failed call says nothing about which tickets closed; only absence
+        # from a successful snapshot does
+        code, msg = error
+        logger.warning("positions_get failed: %s (%s), retrying", code, msg)
+        return MONITOR_RETRY_DELAY
+
+    delay = 15.0
+    by_ticket = {p.ticket: p for p in positions}
+    symbols = {s.symbol for s in _open_tickets.values()}
+    ticks = {sym: await _mt5_call(_tick_cached, sym) for sym in symbols}
+    for ticket, signal in list(_open_tickets.items()):
+        position = by_ticket.get(ticket)
+        if position is None:
+            logger.info("Ticket %s no longer open", ticket)
+            _open_tickets.pop(ticket, None)
+            _breakeven_tickets.discard(ticket)
+            forget_open_position(ticket)
+            continue
+        tick = ticks.get(signal.symbol)
+        if tick is None:
+            if delay > 5.0:
+                delay = 5.0
+            continue
+        entry_price = position.price_open
+        # decide both thresholds here so the executor is only used
+        # for tickets that actually need an order sent; close if price
+        # reverses by more than 0.5%
+        if signal.action == "buy":
+            current_price = tick.bid
+            profit_points = current_price - entry_price
+            reversed_ = current_price < entry_price * 0.995
+            close_type = _ORDER_TYPE_SELL
+        else:
+            current_price = tick.ask
+            profit_points = entry_price - current_price
+            reversed_ = current_price > entry_price * 1.005
+            close_type = _ORDER_TYPE_BUY
+        if ticket not in _breakeven_tickets and profit_points > entry_price * 0.002:
+            await set_break_even(ticket, entry_price)
+            _breakeven_tickets.add(ticket)
+        if reversed_:
+            await close_position(position, signal, close_type, current_price)
+        # poll faster as price moves away from entry towards the
+        # reversal threshold, back off while it sits near entry
+        distance = abs(current_price - entry_price) / entry_price
+        if distance > 0.004:
+            wait = 1.0
+        elif distance < 0.0005:
+            wait = 15.0
+        else:
+            wait = 5.0
+        if wait < delay:
+            delay = wait
+    return delay
+
+
+async def monitor_loop():
+    """Monitor open positions to set break-even and close on reversal."""
+    if mt5 is None:
         return
 
-    request = {
-        "action": mt5.TRADE_ACTION_DEAL,
-        "position": ticket,
-        "symbol": signal.symbol,
-        "volume": volume,
-        "type": close_type,
-        "price": current_price,
-        "deviation": 20,
-        "magic": 1000,
-        "comment": "reversal close",
-        "type_time": mt5.ORDER_TIME_GTC,
-        "type_filling": mt5.ORDER_FILLING_IOC,
-    }
-    result = mt5.order_send(request)
-    if result is None or result.retcode != mt5.TRADE_RETCODE_DONE:
-        logger.error("Failed to close position: %s", result)
-    else:
-        logger.info("Position %s closed", ticket)
-        OPEN_POSITIONS.pop(ticket, None)
-        save_open_positions()
+    while True:
+        try:
+            delay = await _monitor_pass()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # one bad pass must not end monitoring for every ticket
+            logger.exception("Monitor pass failed, retrying")
+            delay = MONITOR_RETRY_DELAY
+        if _monitor_wakeup.is_set():
+            # new tickets arrived mid-pass; just yield instead of arming a timer
+            await asyncio.sleep(0)
+        else:
+            try:
+                await asyncio.wait_for(_monitor_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        _monitor_wakeup.clear()
+
+
+MT5_HEALTH_INTERVAL = 30.0
 
 
-async def monitor_trade(ticket: int, signal: TradeSignal):
-    """Monitor open position to set break-even and close on reversal."""
+async def mt5_watchdog():
+    """Periodically ping the MT5 terminal and reconnect if it went away."""
+    global _mt5_ready
     if mt5 is None:
         return
 
-    breakeven_set = False
     while True:
-        await asyncio.sleep(5)
-        positions = mt5.positions_get(ticket=ticket)
-        if not positions:
-            logger.info("Ticket %s no longer open", ticket)
-            OPEN_POSITIONS.pop(ticket, None)
-            save_open_positions()
-            break
-        position = positions[0]
-        entry_price = position.price_open
-        tick = mt5.symbol_info_tick(signal.symbol)
-        if tick is None:
+        await asyncio.sleep(MT5_HEALTH_INTERVAL)
+        if _mt5_ready and await _mt5_call(mt5.terminal_info) is not None:
             continue
-        current_price = tick.bid if signal.action == "buy" else tick.ask
-        profit_points = current_price - entry_price if signal.action == "buy" else entry_price - current_price
-        if not breakeven_set and profit_points > entry_price * 0.002:
-            set_break_even(ticket, entry_price)
-            breakeven_set = True
-        check_reversal_and_close(ticket, signal)
+        logger.warning("MT5 terminal not reachable, reconnecting")
+        _mt5_ready = False
+        # drop the stale session so initialize starts from a clean state
+        await _mt5_call(mt5.shutdown)
+        if not await _mt5_call(connect_mt5):
+            continue
+        # positions may have opened or closed while we were away; rebuild the
+        # index on the loop so handle_event never sees it half-filled
+        positions, error = await _mt5_call(_positions_get_sync)
+        if positions is None:
+            code, msg = error
+            logger.warning("positions_get failed after reconnect: %s (%s)", code, msg)
+        else:
+            _replace_open_positions(positions)
+            await asyncio.to_thread(compact_open_positions)
+        logger.info("MT5 reconnected")
+        _monitor_wakeup.set()
+
+
+_client: Optional["TelegramClient"] = None
+
+
+async def _get_client():
+    """Return the shared Telegram client, starting it on first use."""
+    global _client
+    if _client is None:
+        _client = TelegramClient("mt5bot", API_ID, API_HASH)
+        await _client.start()
+    return _client
+
+
+async def _run_with_client(mode) -> None:
+    """Run an async mode, then disconnect the shared Telegram client."""
+    try:
+        await mode()
+    finally:
+        if _client is not None:
+            await _client.disconnect()
 
 
 async def test_last_messages():
@@ -426,8 +898,7 @@ async def test_last_messages():
         logger.error("No TELEGRAM_CHANNELS configured for testing")
         return
 
-    client = TelegramClient("mt5bot", API_ID, API_HASH)
-    await client.start()
+    client = await _get_client()
     for channel in ALLOWED_CHANNELS:
         try:
             messages = await client.get_messages(_to_input(channel), limit=2)
@@ -442,7 +913,6 @@ async def test_last_messages():
             signal = parse_signal(text)
             if signal:
                 logger.info("Parsed signal: %s", signal)
-    await client.disconnect()
 
 
 async def list_chats():
@@ -454,8 +924,7 @@ async def list_chats():
         logger.error("TELEGRAM_API_ID and TELEGRAM_API_HASH must be set")
         return
 
-    client = TelegramClient("mt5bot", API_ID, API_HASH)
-    await client.start()
+    client = await _get_client()
 
     async for dialog in client.iter_dialogs():
         entity = dialog.entity
@@ -470,19 +939,14 @@ async def list_chats():
             chat_type = "Unknown"
         logger.info("%s - %s (%s)", dialog.id, name, chat_type)
 
-    await client.disconnect()
-
 
 def place_test_trade():
     """Place a sample trade on the VIX 25 index."""
     if not connect_mt5():
         return
-    refresh_open_positions()
-    refresh_symbols()
     signal = TradeSignal(action="buy", symbol="VIX25", timeframe="1s")
-    place_order(signal)
-    if mt5 is not None:
-        mt5.shutdown()
+    _place_order_sync(signal)
+    shutdown_mt5()
 
 
 async def run_client():
@@ -493,43 +957,54 @@ async def run_client():
         logger.error("TELEGRAM_API_ID and TELEGRAM_API_HASH must be set")
         return
 
+    # main() has already connected and refreshed the local caches
     if not connect_mt5():
         return
-    refresh_open_positions()
-    refresh_symbols()
 
-    client = TelegramClient("mt5bot", API_ID, API_HASH)
+    client = await _get_client()
+    order_lock = asyncio.Lock()
 
     @client.on(events.NewMessage)
     async def handle_event(event):
-        chat = event.chat
-        chat_id = event.chat_id
-        username = getattr(chat, "username", None) if chat else None
-        if (ALLOWED_ID_SET or ALLOWED_NAME_SET) and (
-            chat_id not in ALLOWED_ID_SET and (username or "").lower() not in ALLOWED_NAME_SET
-        ):
-            return
+        if _FILTER_ENABLED:
+            chat_id = event.chat_id
+            if chat_id not in _chat_allow_cache:
+                chat = event.chat
+                username = getattr(chat, "username", None) if chat else None
+                if not (chat_id in ALLOWED_ID_SET or (
+                    username is not None and username.lower() in ALLOWED_NAME_SET
+                )):
+                    return
+                _chat_allow_cache.add(chat_id)
 
         text = event.message.message
         signal = parse_signal(text)
-        if signal and connect_mt5():
-            if any(p.get("symbol") == signal.symbol for p in OPEN_POSITIONS.values()):
-                logger.info("Position already open for %s", signal.symbol)
-                return
-            tickets: List[int] = []
-            for _ in range(POSITIONS_PER_SIGNAL):
-                if not can_open_trade():
-                    logger.warning("Insufficient equity for additional position")
-                    break
-                ticket = place_order(signal)
-                if ticket:
-                    tickets.append(ticket)
-                    OPEN_POSITIONS[ticket] = {"symbol": signal.symbol}
-                    save_open_positions()
-                    asyncio.create_task(monitor_trade(ticket, signal))
-            if tickets:
-                MESSAGE_POSITIONS[event.message.id] = tickets
-        else:
+        if signal and not _mt5_ready:
+            logger.warning("MT5 not ready, dropping signal for %s", signal.symbol)
+        elif signal:
+            # orders are placed off the loop; serialize so a duplicate signal
+            # cannot pass the open-position check while another is in flight
+            async with order_lock:
+                if signal.symbol in OPEN_BY_SYMBOL:
+                    logger.info("Position already open for %s", signal.symbol)
+                    return
+                tickets: List[int] = []
+                for _ in range(POSITIONS_PER_SIGNAL):
+                    if not await can_open_trade():
+                        logger.warning("Insufficient equity for additional position")
+                        break
+                    ticket = await place_order(signal)
+                    if ticket:
+                        tickets.append(ticket)
+                        record_open_position(ticket, {"symbol": signal.symbol})
+                        try:
+                            _monitor_q.put_nowait((ticket, signal))
+                        except asyncio.QueueFull:
+                            logger.warning("Monitor queue full, ticket %s not monitored", ticket)
+                        _monitor_wakeup.set()
+                if tickets:
+                    MESSAGE_POSITIONS[event.message.id] = tickets
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug("No valid signal found in message: %s", text)
 
     @client.on(events.MessageEdited)
@@ -542,11 +1017,22 @@ async def run_client():
         if not signal or signal.stop_loss is None or signal.take_profit is None:
             return
         for ticket in tickets:
-            update_sl_tp(ticket, signal.stop_loss, signal.take_profit)
+            await update_sl_tp(ticket, signal.stop_loss, signal.take_profit)
 
-    await client.start()
     logger.info("Client started")
+    # resolve configured chats up front so the first message isn't delayed
+    for channel in ALLOWED_CHANNELS:
+        try:
+            await client.get_input_entity(_to_input(channel))
+        except Exception as exc:
+            logger.warning("Failed to resolve %s: %s", channel, exc)
+    monitor_task = asyncio.create_task(monitor_loop())
+    watchdog_task = asyncio.create_task(mt5_watchdog())
+    flusher_task = asyncio.create_task(journal_flusher())
     await client.run_until_disconnected()
+    monitor_task.cancel()
+    watchdog_task.cancel()
+    flusher_task.cancel()
 
 
 def main() -> None:
@@ -575,14 +1061,17 @@ def main() -> None:
         refresh_open_positions()
         refresh_symbols()
 
+    if uvloop is not None:
+        uvloop.install()
+
     if args.trade is not None:
         place_test_trade()
     elif args.test:
-        asyncio.run(test_last_messages())
+        asyncio.run(_run_with_client(test_last_messages))
     elif args.groups:
-        asyncio.run(list_chats())
+        asyncio.run(_run_with_client(list_chats))
     else:
-        asyncio.run(run_client())
+        asyncio.run(_run_with_client(run_client))
 
 
 if __name__ == "__main__":